@@ -4,6 +4,7 @@
 import sys
 import argparse
 import csv
+from operator import itemgetter
 
 version = '%(prog)s 20160808'
 
@@ -14,7 +15,7 @@ def ArgParse():
     Create Date: 2016-08-08 ''',
     formatter_class=argparse.RawDescriptionHelpFormatter)
 
-    parser.add_argument('infile', nargs='?', type=argparse.FileType('rU'), metavar='FILE', help='CSV File', default=sys.stdin)
+    parser.add_argument('infile', nargs='?', type=argparse.FileType('r'), metavar='FILE', help='CSV File', default=sys.stdin)
     parser.add_argument('-f', '--fields', action='store', type=str, metavar='LIST', help='select only these fields')
     parser.add_argument('-v', '--version', action='version', version=version)
     args = parser.parse_args()
@@ -22,26 +23,32 @@ def ArgParse():
     return args
 
 def dumpCsv(infile, fields):
-    reader = csv.reader(infile)
-    writer = csv.writer(sys.stdout)
-    if fields == 0 or fields == ['0']:
-        for row in reader:
-            writer.writerow(row)
-    else:
-        for row in reader:
-            line = []
-            for index, col in enumerate(row):
-                for field in fields:
-                    if index == int(field) - 1:
-                        line.append(col)
-            writer.writerow(line)
+    reader = csv.reader(open(infile.fileno(), newline='',
+                             encoding=infile.encoding, closefd=False))
+    with open(sys.stdout.fileno(), 'w', buffering=1 << 20, newline='',
+              encoding=sys.stdout.encoding, closefd=False) as out:
+        writer = csv.writer(out)
+        if fields is None:
+            writer.writerows(reader)
+        elif len(fields) > 1:
+            project = itemgetter(*fields)
+            last = fields[-1]
+            for row in reader:
+                if len(row) > last:
+                    writer.writerow(project(row))
+                else:
+                    writer.writerow([row[i] for i in fields if i < len(row)])
+        else:
+            for row in reader:
+                writer.writerow([row[i] for i in fields if i < len(row)])
 
 if __name__ == "__main__":
     args = ArgParse()
-    if args.fields == None:
-        fields = 0
+    if args.fields == None or args.fields == '0':
+        fields = None
     else:
-        fields = args.fields.split(',')
+        fields = map(int, args.fields.split(','))
+        fields = sorted(i - 1 for i in fields if i > 0)
     dumpCsv(args.infile, fields)
 
 
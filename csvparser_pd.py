@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 
+import os
 import sys
 import argparse
-import pandas as pd
+import shutil
+import stat
 
 version = '%(prog)s 20160810'
 
@@ -13,19 +15,80 @@ def ArgParse():
     Create Date: 2016-08-10 ''',
     formatter_class=argparse.RawDescriptionHelpFormatter)
 
-    parser.add_argument('infile', nargs='?', type=argparse.FileType('rU'), metavar='FILE', help='CSV File', default=sys.stdin)
+    parser.add_argument('infile', nargs='?', type=argparse.FileType('r'), metavar='FILE', help='CSV File', default=sys.stdin)
     parser.add_argument('-f', '--fields', action='store', type=str, metavar='LIST', help='select only these fields')
+    parser.add_argument('-e', '--engine', action='store', choices=['polars', 'pyarrow', 'pandas'], default='polars', help='csv engine (default: polars)')
     parser.add_argument('-v', '--version', action='version', version=version)
     args = parser.parse_args()
 
     return args
 
-def dumpCsv(infile, fields):
+def isRegularFile(infile):
+    return stat.S_ISREG(os.fstat(infile.fileno()).st_mode)
+
+def isMappable(infile):
+    return isRegularFile(infile) and os.fstat(infile.fileno()).st_size > 0
+
+def dumpCsvPolars(infile, fields):
+    import polars as pl
+    if infile is sys.stdin or not isRegularFile(infile):
+        dumpCsvPandas(infile, fields)
+        return
+    lf = pl.scan_csv(infile.name, infer_schema=False, glob=False,
+                     empty_string_is_null=False)
+    if fields is not None:
+        lf = lf.select(pl.nth(fields))
+    lf.sink_csv(sys.stdout)
+
+def dumpCsvPyarrow(infile, fields):
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    source = infile.buffer
+    if not source.peek(1):
+        raise ValueError('No columns to parse from file')
+    # The header is parsed as the first data row so that quoted cells are
+    # handled by pyarrow and fields can be selected by position.
+    include = ['f%d' % i for i in fields]
+    reader = pacsv.open_csv(source,
+        read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=include,
+            include_missing_columns=True,
+            column_types=dict.fromkeys(include, pa.string())))
+    first = reader.read_next_batch()
+    header = [column[0].as_py() for column in first.columns]
+    for i, name in zip(fields, header):
+        if name is None:
+            raise ValueError('field %d is out of range' % (i + 1))
+    schema = pa.schema([(name, pa.string()) for name in header])
+    with pacsv.CSVWriter(sys.stdout.buffer, schema) as writer:
+        writer.write_batch(pa.RecordBatch.from_arrays(first.columns, schema=schema).slice(1))
+        for batch in reader:
+            writer.write_batch(pa.RecordBatch.from_arrays(batch.columns, schema=schema))
+
+def dumpCsvPandas(infile, fields):
+    import pandas as pd
     try:
-        df = pd.read_csv(infile, usecols=fields)
+        reader = pd.read_csv(infile, usecols=fields, chunksize=200000,
+                             memory_map=isMappable(infile))
     except:
         raise
-    print(df.to_csv(index=False)[:-1])
+    for i, chunk in enumerate(reader):
+        chunk.to_csv(sys.stdout, index=False, header=(i == 0), lineterminator='\n')
+
+def dumpCsv(infile, fields, engine):
+    if fields is None:
+        shutil.copyfileobj(infile.buffer, sys.stdout.buffer, 1 << 20)
+        return
+    if not fields:
+        return
+    if engine == 'polars':
+        dumpCsvPolars(infile, fields)
+    elif engine == 'pyarrow':
+        dumpCsvPyarrow(infile, fields)
+    else:
+        dumpCsvPandas(infile, fields)
 
 if __name__ == "__main__":
     args = ArgParse()
@@ -33,6 +96,6 @@ if __name__ == "__main__":
         fields = None
     else:
         fields = map(int, args.fields.split(','))
-        fields = [i - 1 for i in fields]
-    dumpCsv(args.infile, fields)
+        fields = sorted(set(i - 1 for i in fields if i > 0))
+    dumpCsv(args.infile, fields, args.engine)
 